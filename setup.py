@@ -1,39 +1,47 @@
-from setuptools import setup, find_packages
-import os
-
-# Read the contents of README file
-this_directory = os.path.abspath(os.path.dirname(__file__))
-with open(os.path.join(this_directory, 'README.md'), encoding='utf-8') as f:
-    long_description = f.read()
-
-# Read requirements
-with open(os.path.join(this_directory, 'requirements.txt'), encoding='utf-8') as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-
-setup(
-    name="waveflow-studio-sdk",
-    version="0.1.0",
-    author="AgentAnalytics.AI",
-    author_email="support@agentanalytics.ai",
-    description="Python SDK for WaveFlow Studio API",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/agentanalytics/waveflow-studio-sdk",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
-    python_requires=">=3.7",
-    install_requires=requirements,
-    include_package_data=True,
-    zip_safe=False,
-    keywords="waveflow studio api sdk workflow automation",
+from setuptools import setup, find_packages
+import os
+
+# Read the contents of README file
+this_directory = os.path.abspath(os.path.dirname(__file__))
+with open(os.path.join(this_directory, 'README.md'), encoding='utf-8') as f:
+    long_description = f.read()
+
+# Read requirements
+with open(os.path.join(this_directory, 'requirements.txt'), encoding='utf-8') as f:
+    requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+setup(
+    name="waveflow-studio-sdk",
+    version="0.1.0",
+    author="AgentAnalytics.AI",
+    author_email="support@agentanalytics.ai",
+    description="Python SDK for WaveFlow Studio API",
+    long_description=long_description,
+    long_description_content_type="text/markdown",
+    url="https://github.com/agentanalytics/waveflow-studio-sdk",
+    packages=find_packages(),
+    classifiers=[
+        "Development Status :: 3 - Alpha",
+        "Intended Audience :: Developers",
+        "Operating System :: OS Independent",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+    ],
+    python_requires=">=3.7",
+    install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.6"],
+        "http2": ["httpx[http2]>=0.23"],
+        "stream": ["ijson>=3.1"],
+        "async": ["httpx>=0.23"],
+        "upload": ["requests-toolbelt>=0.9"],
+        "brotli": ["brotli>=1.0"],
+    },
+    include_package_data=True,
+    zip_safe=False,
+    keywords="waveflow studio api sdk workflow automation",
 )
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Shared fixtures: mock requests and httpx transports, driven by one route
+table, so the clients can be exercised without a backend.
+"""
+import asyncio
+import json
+import socket
+import uuid
+from http.client import responses as REASONS
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+import urllib3.connection
+from requests.adapters import HTTPAdapter
+
+from waveflow_studio_sdk import WaveFlowStudio
+from waveflow_studio_sdk._base import _CircuitBreaker
+
+
+def _resolve(routes, method, path, request):
+    """
+    Looks up (method, path) in routes: returns (status, body bytes,
+    content type) or raises the route's exception. Unknown routes are 404s.
+    """
+    result = routes.get((method, path), (404, {"detail": "Not Found"}))
+    if callable(result):
+        result = result(request)
+    if isinstance(result, BaseException):
+        raise result
+    status, body = result
+    if isinstance(body, (dict, list)):
+        return status, json.dumps(body).encode(), "application/json"
+    return status, body if isinstance(body, bytes) else body.encode(), "text/plain"
+
+
+class MockAdapter(HTTPAdapter):
+    """
+    Answers requests from a route table instead of the network.
+
+    routes maps (method, path) to a (status, body) tuple, an exception to
+    raise, or a callable taking the PreparedRequest and returning either.
+    Dict and list bodies are sent as JSON.
+    """
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        path = urlsplit(request.url).path
+        self.calls.append((request.method, path))
+        status, content, content_type = _resolve(self.routes, request.method, path, request)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = REASONS.get(status, "")
+        response.url = request.url
+        response.request = request
+        response._content = content
+        response.headers["Content-Type"] = content_type
+        return response
+
+
+@pytest.fixture
+def base_url():
+    # Breakers are shared per base_url, so every test gets its own backend
+    return f"http://mock-{uuid.uuid4().hex[:8]}.test"
+
+
+@pytest.fixture
+def routes():
+    return {}
+
+
+@pytest.fixture
+def adapter(routes):
+    return MockAdapter(routes)
+
+
+@pytest.fixture
+def client(base_url, adapter):
+    # "AAAI" keys skip the /user validation call
+    client = WaveFlowStudio("AAAI-test-key", base_url=base_url)
+    client._session.mount("http://", adapter)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def refused_client(monkeypatch):
+    """A client on the real requests transport whose port refuses connections; counts connect attempts."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    attempts = []
+    new_conn = urllib3.connection.HTTPConnection._new_conn
+
+    def counting_new_conn(conn):
+        attempts.append(conn.port)
+        return new_conn(conn)
+
+    monkeypatch.setattr(urllib3.connection.HTTPConnection, "_new_conn", counting_new_conn)
+    client = WaveFlowStudio("AAAI-test-key", base_url=f"http://127.0.0.1:{port}")
+    # The port may be handed out again; don't inherit an earlier test's breaker
+    client._breaker = _CircuitBreaker()
+    yield client, attempts
+    client.close()
+
+
+@pytest.fixture
+def mock_transport(routes):
+    """httpx.MockTransport answering from routes; requests seen are in .calls."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        transport.calls.append(request)
+        status, content, content_type = _resolve(routes, request.method, request.url.path, request)
+        return httpx.Response(status, content=content, headers={"Content-Type": content_type})
+
+    transport = httpx.MockTransport(handler)
+    transport.calls = []
+    return transport
+
+
+@pytest.fixture
+def async_client(base_url, mock_transport):
+    """AsyncWaveFlowStudio whose httpx client answers from routes."""
+    import httpx
+    from waveflow_studio_sdk import AsyncWaveFlowStudio
+
+    client = AsyncWaveFlowStudio("AAAI-test-key", base_url=base_url)
+    client._client = httpx.AsyncClient(base_url=base_url, transport=mock_transport)
+    yield client
+    asyncio.run(client.aclose())
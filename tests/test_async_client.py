@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import waveflow_studio_sdk  # noqa: E402
+from waveflow_studio_sdk._base import APIError, _key_is_validated, _remember_validated_key  # noqa: E402
+
+# Endpoints documented to raise APIError / Exception("Connection error")
+RAISING = [
+    ("get_user_details", (), ("GET", "/user")),
+    ("get_user_metadata", (), ("GET", "/profile/user-metadata")),
+    ("update_user_runs", ({"runs": 1},), ("POST", "/update-user-runs")),
+    ("delete_connection", ("conn-1",), ("POST", "/delete_connection")),
+]
+
+
+def _run(client, name, *args):
+    return asyncio.run(getattr(client, name)(*args))
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_json_error_raises_api_error(async_client, routes, name, args, route):
+    routes[route] = (403, {"error": "Forbidden"})
+    with pytest.raises(APIError) as excinfo:
+        _run(async_client, name, *args)
+    assert excinfo.value.status_code == 403
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_non_json_error_is_a_connection_error(async_client, routes, name, args, route):
+    # An HTML 502 from a proxy: must not leak httpx.HTTPStatusError
+    routes[route] = (502, "<html>Bad Gateway</html>")
+    with pytest.raises(Exception, match="Connection error") as excinfo:
+        _run(async_client, name, *args)
+    assert not isinstance(excinfo.value, httpx.HTTPError)
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_transport_error_is_a_connection_error(async_client, routes, name, args, route):
+    routes[route] = httpx.ConnectError("refused")
+    with pytest.raises(Exception, match="Connection error: refused"):
+        _run(async_client, name, *args)
+
+
+@pytest.mark.parametrize("name, route", [
+    ("get_tool_info", ("GET", "/app_info")),
+    ("get_tool_fields", ("POST", "/fields")),
+    ("execute_tool", ("POST", "/execute")),
+])
+def test_non_dict_error_bodies_are_reported(async_client, routes, name, route):
+    routes[route] = (422, [{"loc": ["query"], "msg": "field required"}])
+    args = (name, "GMAIL", {}) if name == "execute_tool" else (name, "GMAIL")
+    assert _run(async_client, *args) == {"error": [{"loc": ["query"], "msg": "field required"}]}
+
+
+@pytest.mark.parametrize("status, body", [(500, "Internal failure"), (404, {"detail": "Not Found"})])
+def test_get_tools_error_matches_the_sync_client(client, async_client, routes, status, body):
+    routes[("GET", "/get_tools")] = (status, body)
+    expected = client.get_tools()
+    assert expected["status_code"] == status
+    assert _run(async_client, "get_tools") == expected
+
+
+def test_get_tools_request_failure(async_client, routes):
+    routes[("GET", "/get_tools")] = httpx.ReadTimeout("timed out")
+    assert _run(async_client, "get_tools") == {"error": "Failed to fetch tools", "details": "timed out"}
+
+
+@pytest.mark.parametrize("clear", [
+    lambda: waveflow_studio_sdk.clear_validation_cache(),
+    lambda: waveflow_studio_sdk.WaveFlowStudio.clear_validation_cache(),
+    lambda: waveflow_studio_sdk.AsyncWaveFlowStudio.clear_validation_cache(),
+])
+def test_clear_validation_cache(clear):
+    _remember_validated_key("key-1")
+    clear()
+    assert not _key_is_validated("key-1")
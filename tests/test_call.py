@@ -0,0 +1,49 @@
+import pytest
+import requests
+
+from waveflow_studio_sdk import APIError
+
+# Endpoints that raise APIError on an error status and
+# Exception("Connection error: ...") on a transport failure
+RAISING = [
+    ("deploy_workflow", ("flow-1", "Flow", "desc"), ("POST", "/deploy")),
+    ("rename_workflow", ("session-1", "New name"), ("PUT", "/rename_workflow/")),
+    ("get_workflows_by_model", ("model-1",), ("GET", "/workflows_by_model")),
+    ("get_workflows_by_tool", ("tool-1",), ("GET", "/workflows_by_tool")),
+    ("undeploy_workflow", ("session-1",), ("POST", "/undeploy")),
+    ("workflow_admin_run", ("session-1",), ("POST", "/workflow-admin-run")),
+    ("delete_connection", ("conn-1",), ("POST", "/delete_connection")),
+    ("save_prompt", ("prompt", "session-1"), ("POST", "/save_prompt")),
+    ("fetch_prompt_data", ("session-1",), ("POST", "/fetch_prompt_data")),
+    ("user_query", ("session-1", "user-1", "hello"), ("POST", "/user_query")),
+    ("update_sequence_ids", ("agents.json", ["a"]), ("POST", "/sequence-ids")),
+    ("get_user_metadata", (), ("GET", "/profile/user-metadata")),
+    ("test_automation_workflow", ("session-1", "run it"), ("POST", "/test-automation-workflow")),
+    ("set_model_from_dict", ({"name": "m"},), ("POST", "/set_model_from_json")),
+]
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_returns_the_json_body(client, routes, name, args, route):
+    routes[route] = (200, {"message": "ok"})
+    assert getattr(client, name)(*args) == {"message": "ok"}
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_error_status_raises_api_error(client, routes, name, args, route):
+    routes[route] = (404, {"detail": "Workflow not found"})
+    with pytest.raises(APIError, match="Workflow not found"):
+        getattr(client, name)(*args)
+
+
+@pytest.mark.parametrize("name, args, route", RAISING)
+def test_transport_failure_is_a_connection_error(client, routes, name, args, route):
+    routes[route] = requests.exceptions.ReadTimeout("read timed out")
+    with pytest.raises(Exception, match="Connection error: read timed out"):
+        getattr(client, name)(*args)
+
+
+def test_create_workflow_config_checks_the_body_status(client, routes):
+    routes[("POST", "/workflow-config")] = (200, {"status_code": 400, "message": "bad agents"})
+    with pytest.raises(Exception, match=r"API Error \(400\): bad agents"):
+        client.create_workflow_config("encrypted")
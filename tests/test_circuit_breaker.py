@@ -0,0 +1,130 @@
+import pytest
+import requests
+
+from waveflow_studio_sdk import APIError, CircuitOpenError
+from waveflow_studio_sdk._base import _CircuitBreaker
+
+
+@pytest.fixture
+def breaker(client):
+    breaker = _CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+    client._breaker = breaker
+    return breaker
+
+
+def _cool_down(breaker):
+    # Pretend recovery_timeout has passed since the circuit opened
+    breaker._opened_at -= breaker.recovery_timeout
+
+
+def _open(client, routes, breaker):
+    routes[("GET", "/user")] = (500, {"detail": "boom"})
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(APIError):
+            client.get_user_details()
+    assert breaker.state == breaker.OPEN
+
+
+def test_opens_after_threshold_and_fails_fast(client, routes, adapter, breaker):
+    _open(client, routes, breaker)
+    with pytest.raises(CircuitOpenError):
+        client._request("GET", client._urls["user"])
+    assert len(adapter.calls) == breaker.failure_threshold
+
+
+def test_connection_errors_count_as_failures(client, routes, breaker):
+    routes[("GET", "/user")] = requests.exceptions.ConnectionError("refused")
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(Exception, match="Connection error"):
+            client.get_user_details()
+    assert breaker.state == breaker.OPEN
+
+
+def test_client_errors_do_not_trip_the_breaker(client, routes, breaker):
+    routes[("GET", "/user")] = (404, {"detail": "missing"})
+    for _ in range(breaker.failure_threshold + 1):
+        with pytest.raises(APIError):
+            client.get_user_details()
+    assert breaker.state == breaker.CLOSED
+
+
+def test_half_open_lets_one_probe_through(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert not breaker.allow_request()
+    _cool_down(breaker)
+    assert breaker.allow_request()
+    assert breaker.state == breaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_closes(client, routes, breaker):
+    _open(client, routes, breaker)
+    _cool_down(breaker)
+    routes[("GET", "/user")] = (200, {"status_code": 200})
+    assert client.get_user_details() == {"status_code": 200}
+    assert breaker.state == breaker.CLOSED
+
+
+def test_failed_probe_reopens(client, routes, breaker):
+    _open(client, routes, breaker)
+    _cool_down(breaker)
+    with pytest.raises(APIError):
+        client.get_user_details()
+    assert breaker.state == breaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        client._request("GET", client._urls["user"])
+
+
+def test_probe_failing_before_the_backend_answers_releases_the_slot(client, routes, breaker):
+    _open(client, routes, breaker)
+    _cool_down(breaker)
+    # e.g. a Username header requests can't encode as latin-1
+    routes[("GET", "/user")] = UnicodeEncodeError("latin-1", "李", 0, 1, "ordinal not in range(256)")
+    with pytest.raises(UnicodeEncodeError):
+        client.get_user_details()
+    assert breaker.state == breaker.HALF_OPEN
+
+    routes[("GET", "/user")] = (200, {"status_code": 200})
+    assert client.get_user_details() == {"status_code": 200}
+    assert breaker.state == breaker.CLOSED
+
+
+def test_outage_opens_the_circuit_without_blocking(refused_client):
+    client, attempts = refused_client
+    breaker = client._breaker
+    for _ in range(breaker.failure_threshold):
+        assert client.get_tools()["error"] == "Failed to fetch tools"
+    # One connection attempt per call, then the circuit is open
+    assert len(attempts) == breaker.failure_threshold
+    assert breaker.state == breaker.OPEN
+    assert "Circuit open" in client.get_tools()["details"]
+    assert len(attempts) == breaker.failure_threshold
+
+
+CLIENT_SIDE_ERRORS = [
+    (requests.exceptions.InvalidURL, lambda client: client._request("GET", "http://")),
+    (requests.exceptions.MissingSchema, lambda client: client._request("GET", "mock.test/user")),
+    (requests.exceptions.InvalidSchema, lambda client: client._request("GET", "ftp://mock.test/user")),
+    (requests.exceptions.InvalidHeader,
+     lambda client: client._request("GET", client._urls["user"], headers={"Username": "a\nb"})),
+]
+
+
+@pytest.mark.parametrize("error, call", CLIENT_SIDE_ERRORS)
+def test_client_side_errors_are_not_backend_failures(client, adapter, breaker, error, call):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(error):
+            call(client)
+    assert breaker.state == breaker.CLOSED
+    assert adapter.calls == []
+
+
+@pytest.mark.parametrize("error, call", CLIENT_SIDE_ERRORS)
+def test_client_side_errors_release_the_half_open_probe(client, routes, breaker, error, call):
+    _open(client, routes, breaker)
+    _cool_down(breaker)
+    with pytest.raises(error):
+        call(client)
+    assert breaker.state == breaker.HALF_OPEN
+    assert breaker.allow_request()
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+
+SECTIONS = {
+    "summary": (("GET", "/get-user-summary"), {"workflows": 2}),
+    "details": (("GET", "/profile/user-details"), {"username": "ada"}),
+    "token": (("GET", "/token_data"), {"tokens_used": 120}),
+    "sessions": (("GET", "/session_data"), {"sessions": []}),
+}
+
+
+@pytest.fixture
+def profile(routes):
+    for route, body in SECTIONS.values():
+        routes[route] = (200, body)
+    return routes
+
+
+def test_fetch_all(client, profile):
+    assert client.fetch_all("ada") == {name: body for name, (_, body) in SECTIONS.items()}
+
+
+def test_fetch_all_sends_the_username(client, profile):
+    seen = []
+
+    def details(request):
+        seen.append(request.headers["Username"])
+        return 200, SECTIONS["details"][1]
+
+    profile[SECTIONS["details"][0]] = details
+    client.fetch_all("ada")
+    assert seen == ["ada"]
+
+
+def test_fetch_all_runs_the_calls_concurrently(client, profile):
+    # Every handler waits for all four requests to be in flight at once
+    barrier = threading.Barrier(len(SECTIONS), timeout=5)
+    for route, body in SECTIONS.values():
+        profile[route] = lambda request, body=body: (barrier.wait(), (200, body))[1]
+    assert client.fetch_all()["token"] == SECTIONS["token"][1]
+
+
+@pytest.mark.parametrize("username", ["ada", None])
+def test_fetch_all_warms_the_cached_reads(client, profile, adapter, username):
+    client.fetch_all(username)
+    adapter.calls.clear()
+    client.get_user_summary()
+    # However the later call is spelled
+    client.user_details(username)
+    client.user_details(username=username)
+    if username is None:
+        client.user_details()
+    assert adapter.calls == []
+
+
+def test_fetch_all_reports_failed_sections(client, profile):
+    profile[SECTIONS["token"][0]] = (500, {"error": "boom"})
+    result = client.fetch_all()
+    assert "error" in result["token"]
+    assert result["summary"] == SECTIONS["summary"][1]
+
+
+def test_async_fetch_all(async_client, profile, mock_transport):
+    result = asyncio.run(async_client.fetch_all("ada"))
+    assert result == {name: body for name, (_, body) in SECTIONS.items()}
+    assert len(mock_transport.calls) == len(SECTIONS)
+
+
+def test_async_fetch_all_reports_exceptions_as_errors(async_client, profile, monkeypatch):
+    async def boom(username=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(async_client, "user_details", boom)
+    result = asyncio.run(async_client.fetch_all())
+    assert result["details"] == {"error": "boom"}
+    assert result["summary"] == SECTIONS["summary"][1]
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+from waveflow_studio_sdk import APIError, WaveFlowStudio  # noqa: E402
+from waveflow_studio_sdk import _base  # noqa: E402
+
+
+@pytest.fixture
+def h2_client(base_url, mock_transport):
+    """WaveFlowStudio on the HTTP/2 transport, with its httpx client answering from routes."""
+    pytest.importorskip("h2")
+    client = WaveFlowStudio("AAAI-test-key", base_url=base_url, use_http2=True)
+    session = client._session
+    session._client = httpx.Client(transport=mock_transport, headers=session.headers)
+    session.headers = session._client.headers
+    yield client
+    client.close()
+
+
+def test_json_round_trip(h2_client, routes, mock_transport):
+    routes[("GET", "/user")] = (200, {"status_code": 200})
+    assert h2_client.get_user_details() == {"status_code": 200}
+    request, = mock_transport.calls
+    assert request.headers["Authorization"] == "Bearer AAAI-test-key"
+
+
+def test_raw_bodies_and_form_pairs(h2_client, routes, mock_transport):
+    routes[("POST", "/execute")] = (200, {"success": True, "result": "done"})
+    routes[("POST", "/user_query")] = (200, {"message": "success"})
+    assert h2_client.execute_tool("SLUG", {"q": 1}) == "done"
+    assert h2_client.user_query("session-1", "user-1", "hello") == {"message": "success"}
+    execute, query = mock_transport.calls
+    assert json.loads(execute.content) == {"slug": "SLUG", "arguments": {"q": 1}}
+    assert execute.headers["Content-Type"] == "application/json"
+    assert query.headers["Content-Type"] == "application/x-www-form-urlencoded"
+    assert b"query=hello" in query.content
+
+
+def test_error_status_raises_api_error(h2_client, routes):
+    routes[("GET", "/user")] = (404, {"detail": "User not found"})
+    with pytest.raises(APIError, match="User not found") as excinfo:
+        h2_client.get_user_details()
+    assert excinfo.value.status_code == 404
+
+
+def test_raise_for_status_matches_requests(h2_client, routes):
+    routes[("GET", "/token_data")] = (503, "maintenance")
+    response = h2_client._request("GET", h2_client._urls["token_data"])
+    with pytest.raises(requests.exceptions.HTTPError, match="503 Server Error: Service Unavailable for url: ") as excinfo:
+        response.raise_for_status()
+    assert excinfo.value.response is response
+
+
+@pytest.mark.parametrize("raised, expected", [
+    (httpx.ConnectTimeout("connect timed out"), requests.exceptions.ConnectTimeout),
+    (httpx.ReadTimeout("read timed out"), requests.exceptions.Timeout),
+    (httpx.ConnectError("refused"), requests.exceptions.ConnectionError),
+    (httpx.RemoteProtocolError("reset"), requests.exceptions.RequestException),
+    (httpx.DecodingError("bad gzip"), requests.exceptions.RequestException),
+])
+def test_httpx_errors_become_requests_errors(h2_client, routes, raised, expected):
+    routes[("GET", "/user")] = raised
+    with pytest.raises(expected) as excinfo:
+        h2_client._request("GET", h2_client._urls["user"])
+    assert excinfo.value.__cause__ is raised
+
+
+def test_only_connect_errors_are_retried(h2_client, routes, mock_transport, monkeypatch):
+    monkeypatch.setattr(_base.time, "sleep", lambda seconds: None)
+    routes[("POST", "/execute")] = httpx.ConnectError("refused")
+    assert "refused" in h2_client.execute_tool("SLUG", {})["error"]
+    assert len(mock_transport.calls) == 3
+
+    mock_transport.calls.clear()
+    routes[("POST", "/execute")] = httpx.RemoteProtocolError("reset")
+    assert "reset" in h2_client.execute_tool("SLUG", {})["error"]
+    assert len(mock_transport.calls) == 1
+
+
+def test_iter_sessions_without_a_raw_stream(h2_client, routes):
+    routes[("GET", "/session_data")] = (200, {"sessions": [{"id": "s1"}, {"id": "s2"}]})
+    assert [session["id"] for session in h2_client.iter_sessions()] == ["s1", "s2"]
@@ -0,0 +1,95 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from waveflow_studio_sdk import _base
+
+EXECUTE = ("POST", "/execute")
+
+
+def _refused():
+    reason = NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/execute", reason))
+
+
+def _reset():
+    reason = ProtocolError("Connection aborted.", ConnectionResetError(104, "Connection reset by peer"))
+    return requests.exceptions.ConnectionError(reason)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(_base.time, "sleep", lambda seconds: None)
+
+
+def _failing_then_ok(error, failures):
+    attempts = []
+
+    def execute(request):
+        attempts.append(request)
+        if len(attempts) <= failures:
+            return error()
+        return 200, {"success": True, "result": "done"}
+
+    return execute
+
+
+@pytest.mark.parametrize("error", [
+    _refused,
+    lambda: requests.exceptions.ConnectTimeout("connect timed out"),
+])
+def test_retries_failures_before_the_request_is_sent(client, routes, adapter, error):
+    routes[EXECUTE] = _failing_then_ok(error, failures=2)
+    assert client.execute_tool("SLUG", {}) == "done"
+    assert adapter.calls.count(EXECUTE) == 3
+
+
+@pytest.mark.parametrize("error", [
+    _reset,
+    lambda: requests.exceptions.ConnectionError("Remote end closed connection without response"),
+    lambda: requests.exceptions.ReadTimeout("read timed out"),
+])
+def test_never_replays_a_request_that_may_have_been_sent(client, routes, adapter, error):
+    routes[EXECUTE] = _failing_then_ok(error, failures=1)
+    assert "Request failed" in client.execute_tool("SLUG", {})["error"]
+    assert adapter.calls.count(EXECUTE) == 1
+
+
+def test_gives_up_after_the_last_attempt(client, routes, adapter):
+    routes[EXECUTE] = _failing_then_ok(_refused, failures=3)
+    assert "Connection refused" in client.execute_tool("SLUG", {})["error"]
+    assert adapter.calls.count(EXECUTE) == 3
+
+
+def test_http_errors_are_not_retried(client, routes, adapter):
+    routes[EXECUTE] = (503, {"error": "busy"})
+    assert client.execute_tool("SLUG", {}) == {"error": "busy"}
+    assert adapter.calls.count(EXECUTE) == 1
+
+
+def test_httpx_connect_errors_count_as_before_send():
+    httpx = pytest.importorskip("httpx")
+    from waveflow_studio_sdk._transport import _load_httpx
+
+    _load_httpx()
+    try:
+        raise requests.exceptions.ConnectionError("refused") from httpx.ConnectError("refused")
+    except requests.exceptions.ConnectionError as e:
+        assert _base._failed_before_send(e)
+    try:
+        raise requests.exceptions.ConnectionError("reset") from httpx.RemoteProtocolError("reset")
+    except requests.exceptions.ConnectionError as e:
+        assert not _base._failed_before_send(e)
+
+
+def test_refused_write_is_attempted_three_times(refused_client):
+    client, attempts = refused_client
+    assert "Request failed" in client.execute_tool("SLUG", {})["error"]
+    assert len(attempts) == 3
+
+
+def test_refused_read_is_attempted_once(refused_client):
+    # Connection failures are left to _with_network_retry, never the adapter
+    client, attempts = refused_client
+    assert client.get_tools()["error"] == "Failed to fetch tools"
+    assert len(attempts) == 1
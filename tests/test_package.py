@@ -0,0 +1,16 @@
+import pytest
+
+import waveflow_studio_sdk
+from waveflow_studio_sdk import _base
+
+
+@pytest.mark.parametrize("name", ["APIError", "CircuitOpenError", "InvalidAPIKeyError"])
+def test_public_names_are_exported(name):
+    assert name in waveflow_studio_sdk.__all__
+    assert getattr(waveflow_studio_sdk, name) is getattr(_base, name)
+
+
+def test_star_import_resolves_every_name():
+    namespace = {}
+    exec("from waveflow_studio_sdk import *", namespace)
+    assert set(waveflow_studio_sdk.__all__) <= set(namespace)
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+from waveflow_studio_sdk import APIError
+
+FIELDS_BODY = {"fields": [{"name": "query", "required": True}]}
+EXECUTE_BODY = {"success": True, "result": {"hits": 3}}
+APP_INFO_BODY = [{"slug": "GMAIL_SEND_EMAIL"}]
+GROQ_MODELS_BODY = ["llama3-8b"]
+
+# What each op's endpoint answers, directly or as a /batch entry
+BODIES = {
+    "get_tool_fields": FIELDS_BODY,
+    "execute_tool": EXECUTE_BODY,
+    "get_tool_info": APP_INFO_BODY,
+    "get_user_summary": {"workflows": 2},
+}
+
+
+@pytest.fixture
+def endpoints(routes):
+    routes[("POST", "/fields")] = (200, FIELDS_BODY)
+    routes[("POST", "/execute")] = (200, EXECUTE_BODY)
+    routes[("GET", "/app_info")] = (200, APP_INFO_BODY)
+    routes[("GET", "/get-groq-models")] = (200, GROQ_MODELS_BODY)
+    routes[("GET", "/get-user-summary")] = (200, BODIES["get_user_summary"])
+    return routes
+
+
+@pytest.fixture
+def batches(endpoints):
+    """Serves /batch from BODIES and records each batch's ops."""
+    seen = []
+
+    def batch(request):
+        ops = [entry["op"] for entry in json.loads(request.body)]
+        seen.append(ops)
+        return 200, [BODIES[op] for op in ops]
+
+    endpoints[("POST", "/batch")] = batch
+    return seen
+
+
+def _queue(client):
+    with client.pipeline() as pipe:
+        futures = [
+            pipe.get_tool_fields("GMAIL_SEND_EMAIL"),
+            pipe.execute_tool("FIRECRAWL_SEARCH", {"query": "x"}),
+            pipe.get_tool_info("gmail"),
+            pipe.get_models_by_provider("groq"),
+        ]
+    return [future.result() for future in futures]
+
+
+def _direct(client):
+    return [
+        client.get_tool_fields("GMAIL_SEND_EMAIL"),
+        client.execute_tool("FIRECRAWL_SEARCH", {"query": "x"}),
+        client.get_tool_info("gmail"),
+        client.get_models_by_provider("groq"),
+    ]
+
+
+def test_batched_results_match_direct_calls(client, batches):
+    assert _queue(client) == _direct(client)
+    # get_models_by_provider wraps its response, so it is never batched
+    assert batches == [["get_tool_fields", "execute_tool", "get_tool_info"]]
+
+
+def test_fallback_results_match_direct_calls(client, endpoints, adapter):
+    endpoints[("POST", "/batch")] = (404, {"detail": "Not Found"})
+    assert _queue(client) == _direct(client)
+    # The missing endpoint is remembered for the next pipeline
+    adapter.calls.clear()
+    _queue(client)
+    assert ("POST", "/batch") not in adapter.calls
+
+
+def test_read_only_batch_keeps_the_response_cache(client, batches, adapter):
+    client.get_user_summary()
+    with client.pipeline() as pipe:
+        pipe.get_tool_info("gmail")
+    client.get_user_summary()
+    assert adapter.calls.count(("GET", "/get-user-summary")) == 1
+
+
+def test_batch_with_a_write_clears_the_response_cache(client, batches, adapter):
+    client.get_user_summary()
+    with client.pipeline() as pipe:
+        pipe.execute_tool("FIRECRAWL_SEARCH", {"query": "x"})
+    client.get_user_summary()
+    assert adapter.calls.count(("GET", "/get-user-summary")) == 2
+
+
+def test_failed_batch_fails_its_futures(client, endpoints):
+    endpoints[("POST", "/batch")] = (500, {"detail": "boom"})
+    with client.pipeline() as pipe:
+        fields = pipe.get_tool_fields("GMAIL_SEND_EMAIL")
+        models = pipe.get_models_by_provider("groq")
+    with pytest.raises(APIError):
+        fields.result()
+    assert models.result() == {"provider": "groq", "models": GROQ_MODELS_BODY}
+
+
+def test_malformed_batch_response(client, endpoints):
+    endpoints[("POST", "/batch")] = (200, [FIELDS_BODY])
+    with client.pipeline() as pipe:
+        first = pipe.get_tool_fields("A")
+        second = pipe.get_tool_fields("B")
+    for future in (first, second):
+        with pytest.raises(APIError, match="Malformed"):
+            future.result()
+
+
+def test_nothing_is_sent_if_the_block_raises(client, batches, adapter):
+    with pytest.raises(RuntimeError):
+        with client.pipeline() as pipe:
+            future = pipe.get_tool_info("gmail")
+            raise RuntimeError
+    assert future.cancelled()
+    assert adapter.calls == []
+
+
+def test_application_404_does_not_disable_batching(client, endpoints, adapter):
+    endpoints[("POST", "/batch")] = (404, {"detail": "Tool GMAIL_SEND_EMAIL not found"})
+    with client.pipeline() as pipe:
+        fields = pipe.get_tool_fields("GMAIL_SEND_EMAIL")
+    with pytest.raises(APIError, match="not found"):
+        fields.result()
+    # Not mistaken for a missing endpoint: the next pipeline tries /batch again
+    with client.pipeline() as pipe:
+        pipe.get_tool_fields("GMAIL_SEND_EMAIL")
+    assert adapter.calls.count(("POST", "/batch")) == 2
+    assert ("POST", "/fields") not in adapter.calls
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from waveflow_studio_sdk import APIError
+
+JSON_ROUTE = ("POST", "/set_model_from_json")
+UPLOAD_ROUTE = ("POST", "/set_model_from_file")
+SAVED = {"message": "Model saved"}
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps({"id": "m1", "client": "groq", "model_name": "llama3-8b"}))
+    return str(path)
+
+
+def test_small_files_use_the_json_route(client, routes, adapter, model_file):
+    routes[JSON_ROUTE] = (200, SAVED)
+    assert client.set_model_from_file(model_file) == SAVED
+    assert adapter.calls == [JSON_ROUTE]
+
+
+@pytest.mark.parametrize("missing", [(404, {"detail": "Not Found"}), (405, {"detail": "Method Not Allowed"})])
+def test_missing_json_route_is_remembered(client, routes, adapter, model_file, missing):
+    routes[JSON_ROUTE] = missing
+    routes[UPLOAD_ROUTE] = (200, SAVED)
+    assert client.set_model_from_file(model_file) == SAVED
+    assert adapter.calls == [JSON_ROUTE, UPLOAD_ROUTE]
+
+    adapter.calls.clear()
+    assert client.set_model_from_file(model_file) == SAVED
+    assert adapter.calls == [UPLOAD_ROUTE]
+
+
+def test_application_404_is_raised_not_retried_as_upload(client, routes, adapter, model_file):
+    routes[JSON_ROUTE] = (404, {"detail": "Client 'groq' not found"})
+    routes[UPLOAD_ROUTE] = (200, SAVED)
+    for _ in range(2):
+        with pytest.raises(APIError, match="Client 'groq' not found"):
+            client.set_model_from_file(model_file)
+    assert adapter.calls == [JSON_ROUTE, JSON_ROUTE]
@@ -0,0 +1,60 @@
+import pytest
+
+from waveflow_studio_sdk import APIError
+from waveflow_studio_sdk import client as client_module
+
+SESSIONS = [{"id": "s1", "title": "First"}, {"id": "s2", "title": "Second"}]
+FILE = {"filename": "tool.py", "status": "success", "content": "x" * 10}
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def streaming(request, monkeypatch):
+    """Runs a test with ijson and again with the fallback used when it is missing."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(client_module, "ijson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("body", [SESSIONS, {"sessions": SESSIONS}])
+def test_iter_sessions(client, routes, streaming, body):
+    routes[("GET", "/session_data")] = (200, body)
+    assert list(client.iter_sessions()) == SESSIONS
+
+
+def test_iter_sessions_error_status(client, routes, streaming):
+    routes[("GET", "/session_data")] = (500, {"error": "boom"})
+    with pytest.raises(APIError):
+        list(client.iter_sessions())
+
+
+def test_iter_sessions_can_stop_early(client, routes):
+    pytest.importorskip("ijson")
+    routes[("GET", "/session_data")] = (200, SESSIONS)
+    sessions = client.iter_sessions()
+    assert next(sessions) == SESSIONS[0]
+    sessions.close()
+
+
+def test_view_file_streaming(client, routes, streaming):
+    routes[("GET", "/view_file")] = (200, FILE)
+    chunks = []
+    result = client.view_file_streaming("tool-1", chunks.append, chunk_size=4)
+    assert chunks == ["xxxx", "xxxx", "xx"]
+    assert result == {"filename": "tool.py", "status": "success"}
+
+
+def test_view_file_streaming_error_status(client, routes, streaming):
+    routes[("GET", "/view_file")] = (404, {"detail": "File not found"})
+    chunks = []
+    result = client.view_file_streaming("tool-1", chunks.append)
+    assert chunks == []
+    assert result["status"] == "error"
+    assert result["status_code"] == 404
+    assert "File not found" in result["message"]
+
+
+def test_view_file_streaming_requires_a_tool_id(client, adapter):
+    assert client.view_file_streaming("", print) == {"error": "Tool ID is required."}
+    assert adapter.calls == []
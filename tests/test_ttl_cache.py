@@ -0,0 +1,77 @@
+import pytest
+
+from waveflow_studio_sdk import _base
+
+SUMMARY = ("GET", "/get-user-summary")
+
+
+@pytest.fixture
+def summary(routes):
+    routes[SUMMARY] = (200, {"workflows": [{"id": "w1"}]})
+    return routes
+
+
+def test_repeat_calls_are_served_from_the_cache(client, summary, adapter):
+    assert client.get_user_summary() == client.get_user_summary()
+    assert adapter.calls.count(SUMMARY) == 1
+
+
+def test_callers_get_independent_copies(client, summary):
+    first = client.get_user_summary()
+    first["workflows"].append({"id": "mine"})
+    second = client.get_user_summary()
+    second["workflows"][0]["id"] = "changed"
+    assert client.get_user_summary() == {"workflows": [{"id": "w1"}]}
+
+
+def test_error_payloads_are_not_cached(client, routes, adapter):
+    routes[SUMMARY] = (500, "down")
+    assert "error" in client.get_user_summary()
+    routes[SUMMARY] = (200, {"workflows": []})
+    assert client.get_user_summary() == {"workflows": []}
+    assert adapter.calls.count(SUMMARY) == 2
+
+
+def test_entries_expire(client, summary, adapter, monkeypatch):
+    now = _base.time.monotonic()
+    monkeypatch.setattr(_base.time, "monotonic", lambda: now)
+    client.get_user_summary()
+    now += 61  # get_user_summary caches for 60s
+    client.get_user_summary()
+    assert adapter.calls.count(SUMMARY) == 2
+
+
+def test_invalidate_cache(client, summary, adapter):
+    client.get_user_summary()
+    client.invalidate_cache()
+    client.get_user_summary()
+    assert adapter.calls.count(SUMMARY) == 2
+
+
+def test_lru_eviction():
+    cache = _base._TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is _base._MISSING
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_equivalent_calls_share_an_entry(client, routes, adapter):
+    details = ("GET", "/profile/user-details")
+    routes[details] = (200, {"username": "Unknown"})
+    client.user_details()
+    client.user_details(None)
+    client.user_details(username=None)
+    assert adapter.calls.count(details) == 1
+    client.user_details("ada")
+    assert adapter.calls.count(details) == 2
+
+
+def test_timeout_is_not_part_of_the_key(client, routes, adapter):
+    tools = ("GET", "/get_tools")
+    routes[tools] = (200, [{"id": "t1"}])
+    client.get_tools()
+    client.get_tools(timeout=5)
+    assert adapter.calls.count(tools) == 1
@@ -1,3 +1,19 @@
-from .client import WaveFlowStudio
-
-__all__ = ["WaveFlowStudio"]
+from ._base import APIError, CircuitOpenError, InvalidAPIKeyError, clear_validation_cache
+from .client import WaveFlowStudio
+
+__all__ = [
+    "WaveFlowStudio",
+    "AsyncWaveFlowStudio",
+    "APIError",
+    "CircuitOpenError",
+    "InvalidAPIKeyError",
+    "clear_validation_cache",
+]
+
+
+def __getattr__(name):
+    # AsyncWaveFlowStudio pulls in httpx; import it only when first requested (PEP 562)
+    if name == "AsyncWaveFlowStudio":
+        from .async_client import AsyncWaveFlowStudio
+        return AsyncWaveFlowStudio
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
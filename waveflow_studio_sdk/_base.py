@@ -0,0 +1,602 @@
+"""
+Shared base for the WaveFlowStudio clients.
+"""
+import requests
+import copy
+import json
+from typing import Optional, Any, Callable
+import functools
+import hashlib
+import inspect
+import random
+import threading
+import time
+import types
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib3.util.retry import Retry
+
+from ._transport import _HTTPXSession, _is_connect_error
+
+try:
+    # Optional speed-up: pip install "waveflow-studio-sdk[fast]"
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# (connect, read) timeouts in seconds. LLM-backed endpoints get a longer read timeout.
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 30.0
+LLM_READ_TIMEOUT = 120.0
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+LLM_TIMEOUT = (CONNECT_TIMEOUT, LLM_READ_TIMEOUT)
+
+# Transient failures retried on the session's connection pool. Only idempotent
+# methods are retried there, and never on connection failures: those are
+# retried only by _with_network_retry, for writes, so attempts don't multiply
+# and the circuit breaker sees an outage right away.
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+RETRY_METHODS = frozenset(["GET", "HEAD"])
+
+def _default_retry(methods=RETRY_METHODS) -> Retry:
+    """
+    Build the default Retry policy: 5 attempts with jittered exponential backoff
+    that honours Retry-After. The final response is returned rather than raised
+    so callers still see the server's error body. Connection failures are not
+    retried (connect=0).
+    """
+    kwargs = dict(
+        total=5,
+        connect=0,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    params = inspect.signature(Retry.__init__).parameters
+    if "backoff_jitter" in params:
+        # urllib3 >= 2.0
+        kwargs["backoff_jitter"] = 0.5
+    # urllib3 < 1.26 calls it method_whitelist
+    kwargs["allowed_methods" if "allowed_methods" in params else "method_whitelist"] = methods
+    return Retry(**kwargs)
+
+# Static endpoint paths; full URLs are built once per client in __init__.
+_ENDPOINTS = (
+    "user", "workflow-config", "read-workflows", "workflow-run-chat-pdf-sdk",
+    "get-session-history", "enhance_prompt", "create_agent", "get-together-models",
+    "surprise_me", "assign_roles", "get_tools", "get-groq-models", "get-gemini-models",
+    "get-openai-models", "get-enums-by-app", "get-user-summary", "return_models",
+    "return_agents", "agent_data", "session_data", "save", "run", "return_workflows",
+    "set_model", "reset", "get-agents", "add-tools", "extract-text",
+    "workflow-run-chat-pdf", "apps", "connections", "initiate-connection",
+    "add_executor", "update-user-workflows", "file_upload", "get_workflows",
+    "publish_workflow", "deploy", "workflow_admin", "rename_workflow/",
+    "workflows_by_model", "workflows_by_tool", "undeploy", "workflow-admin-run",
+    "model_health_check", "get_models", "update_model", "download_file", "view_file",
+    "filter_apps", "app_info", "fields", "execute", "delete_connection", "history",
+    "update-agent", "prompt_framework", "chat_pdf", "file", "save_prompt",
+    "fetch_prompt_data", "user_query", "sequence-ids", "show_all_prompt_data",
+    "prompt_testing_copy", "profile/user-details", "token_data", "update-user-runs",
+    "edit-with-ai", "profile/user-metadata", "test-automation-workflow",
+    "set_model_from_json", "set_model_from_file", "batch",
+    # Prefixes for paths that end in an id
+    "delete-workflow/", "delete-tool/", "delete_model/",
+)
+
+_MISSING = object()
+# Shared read-only stand-in for an absent nested dict
+_EMPTY = types.MappingProxyType({})
+# Per-call extras on top of the session's default Authorization header. Frozen
+# so one caller can't mutate the mapping every client shares.
+_JSON_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+# Error-body keys checked in order: "detail" (FastAPI), then "error", then "message"
+_ERROR_KEYS = ("detail", "error", "message")
+
+def _failed_before_send(exc: requests.exceptions.ConnectionError) -> bool:
+    """
+    True if exc shows the request never reached the server: a connect timeout,
+    or a connection that could not be opened (urllib3's NewConnectionError,
+    usually wrapped in MaxRetryError, or httpx's ConnectError).
+    """
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError) or _is_connect_error(exc.__cause__)
+
+def _body_error(data, default="Unknown error occurred"):
+    """The "error" field of a decoded error body, or the body itself if it isn't an object."""
+    return data.get("error", default) if isinstance(data, dict) else data
+
+def _tool_fields_result(data):
+    """get_tool_fields' return value for a successful /fields response body."""
+    return data.get("fields", data) if isinstance(data, dict) else data
+
+def _execute_tool_result(data, ok: bool = True):
+    """execute_tool's return value for an /execute response body."""
+    if ok and isinstance(data, dict) and data.get("success"):
+        return data["result"]
+    return {"error": _body_error(data, data)}
+
+def _http_error_details(status_code: int, reason: str, url) -> str:
+    """Same text as requests' raise_for_status, for error dicts built without raising."""
+    kind = "Client" if status_code < 500 else "Server"
+    return f"{status_code} {kind} Error: {reason} for url: {url}"
+
+# sha256(api_key) -> monotonic expiry for keys that passed /user validation
+# in this process. Hashes rather than raw keys so secrets are not kept around.
+_VALIDATION_CACHE = {}
+_VALIDATION_LOCK = threading.Lock()
+_VALIDATION_TTL = 600.0
+# API keys with this prefix skip /user validation; the backend checks them on use
+_AAAI_PREFIX = "AAAI"
+
+def _key_is_validated(api_key: str) -> bool:
+    """True if api_key passed /user validation within the last _VALIDATION_TTL seconds."""
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    with _VALIDATION_LOCK:
+        return _VALIDATION_CACHE.get(key_hash, 0) > time.monotonic()
+
+def _remember_validated_key(api_key: str):
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    with _VALIDATION_LOCK:
+        _VALIDATION_CACHE[key_hash] = time.monotonic() + _VALIDATION_TTL
+
+def clear_validation_cache():
+    """
+    Forget which API keys passed /user validation in this process, so the
+    next client constructed with any key validates it against the server
+    again. The cache is shared by every client, sync and async.
+    """
+    with _VALIDATION_LOCK:
+        _VALIDATION_CACHE.clear()
+
+class InvalidAPIKeyError(Exception):
+    """Raised when the API key is invalid."""
+    pass
+
+class APIError(Exception):
+    """Raised when the API responds with an HTTP error status."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without contacting the backend while its circuit breaker is open."""
+    pass
+
+class _CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one backend. Opens after failure_threshold
+    consecutive timeouts, connection errors or 5xx responses, fails fast for
+    recovery_timeout seconds, then lets a single probe through (half-open):
+    success closes the circuit, failure re-opens it. A probe that ends
+    without an outcome gives its slot back via release_probe().
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            # Still cooling down, or a half-open probe is already in flight
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release_probe(self):
+        """
+        Free the half-open probe slot without recording an outcome, for calls
+        that failed before the backend could answer; the next call probes.
+        """
+        with self._lock:
+            self._probing = False
+
+# RequestExceptions requests raises while building the request, before anything
+# is sent; they say nothing about the backend's health.
+_CLIENT_SIDE_ERRORS = (
+    requests.exceptions.InvalidURL,
+    requests.exceptions.InvalidHeader,
+    requests.exceptions.MissingSchema,
+    requests.exceptions.InvalidSchema,
+)
+
+# base_url -> _CircuitBreaker, shared by every client talking to that backend
+_BREAKERS = {}
+_BREAKERS_LOCK = threading.Lock()
+
+def _breaker_for(base_url: str) -> _CircuitBreaker:
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(base_url)
+        if breaker is None:
+            breaker = _BREAKERS[base_url] = _CircuitBreaker()
+        return breaker
+
+class _TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a per-entry TTL.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+def _ttl_cached(ttl: float, key: Optional[Callable[..., Any]] = None, cache: str = "_models_cache"):
+    """
+    Cache a method's successful results in ``self.<cache>`` (a _TTLCache,
+    ``self._models_cache`` by default) for ``ttl`` seconds.
+
+    Results are keyed by method name and call arguments (or by ``key(*args)``
+    when given). Arguments are bound to the signature with defaults applied,
+    so f(), f(None) and f(x=None) share an entry; ``timeout`` doesn't change
+    the result and is left out of the key. Error payloads (dicts with an
+    "error" key) are never cached.
+
+    Every caller gets its own deep copy, so mutating a returned dict or list
+    never changes what the cache hands out next.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def call_key(self, args, kwargs):
+            if key:
+                return key(*args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return tuple(
+                (name, value) for name, value in bound.arguments.items()
+                if name not in ("self", "timeout")
+            )
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache_key = (func.__name__, call_key(self, args, kwargs))
+            store = getattr(self, cache)
+            value = store.get(cache_key)
+            if value is not _MISSING:
+                return copy.deepcopy(value)
+            value = func(self, *args, **kwargs)
+            if not (isinstance(value, dict) and "error" in value):
+                store.set(cache_key, copy.deepcopy(value), ttl)
+            return value
+        return wrapper
+    return decorator
+
+class _WaveFlowStudioBase:
+    """
+    Shared client plumbing: session, URLs, headers, API key validation and
+    response handling. Endpoint methods live on the subclasses.
+
+    Instances use __slots__; new instance attributes must be added here and
+    subclasses declare __slots__ = ().
+    """
+
+    __slots__ = (
+        "api_key", "base_url", "workflow_id", "_session", "_models_cache",
+        "_response_cache", "_urls", "_json_headers", "_default_timeout",
+        "_breaker", "_send",
+    )
+
+    def __init__(self, api_key: str, base_url: str = "http://3.92.146.100:5000", use_http2: bool = False,
+                 retry: Optional[Retry] = None, timeout=DEFAULT_TIMEOUT):
+        """
+        Initialize SDK with API key and validate.
+
+        Set use_http2=True to send every call over a single multiplexed
+        HTTP/2 connection (requires: pip install "waveflow-studio-sdk[http2]").
+        HTTP/2 is only negotiated over TLS, so this needs an https:// base_url;
+        with http:// the httpx transport speaks HTTP/1.1.
+
+        retry is the urllib3 Retry policy mounted on the requests session
+        (default: 5 retries with jittered backoff on 429/502/503/504, GET and
+        HEAD only, so non-idempotent POSTs such as execute_tool or
+        run_prompt_test_copy are never replayed on a 5xx). The default never
+        retries a failed connection; execute_tool, add_tool, delete_tool and
+        delete_connection retry those themselves, so a custom policy should
+        keep connect=0 too. Not used with use_http2=True.
+
+        timeout is the default (connect, read) timeout in seconds for every
+        call; most methods also accept a per-call timeout= override.
+        """
+        self.api_key = api_key
+        self._default_timeout = timeout
+        self.base_url = base_url.rstrip("/")
+        self._breaker = _breaker_for(self.base_url)
+        if use_http2:
+            self._session = _HTTPXSession(timeout)
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=retry if retry is not None else _default_retry(),
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        # Bound once so _request skips the session attribute lookups per call
+        self._send = self._session.request
+        self._models_cache = _TTLCache(maxsize=128)
+        self._response_cache = _TTLCache(maxsize=256)
+        self._urls = {path: f"{self.base_url}/{path}" for path in _ENDPOINTS}
+        # Sent with every call; add_tool overrides it with its own token.
+        # Accept-Encoding is left to the transport: requests/urllib3 and httpx
+        # add "br" on their own when the brotli extra is installed.
+        self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+        self._json_headers = _JSON_HEADERS
+        self._validate_api_key()
+        self.workflow_id = None
+
+    # def _validate_api_key(self) -> str:
+    #     """
+    #     Validate API key with server and return user_id if valid.
+    #     """
+    #     url = f"{self.base_url}/user"
+    #     headers = {"Authorization": f"Bearer {self.api_key}"}
+
+    #     try:
+    #         response = requests.get(url, headers=headers)
+    #         res = response.json()
+    #         if res.get("status_code") == 200:
+    #             user_id = res.get("content").get("valid")
+    #             if not user_id:
+    #                 raise InvalidAPIKeyError("API key not associated with any user.")
+    #             return 
+    #         elif response.status_code == 401:
+    #             raise InvalidAPIKeyError("Invalid API key provided.")
+    #         else:
+    #             raise Exception(f"Unexpected error: {response.status_code} - {response.text}")
+    #     except requests.RequestException as e:
+    #         raise Exception(f"[ERROR] API validation failed: {e}")
+
+    def _validate_api_key(self):
+        """
+        Validate API key:
+        - If AAAI key → trust backend during usage (skip /user validation)
+        - If normal JWT → validate by calling /user
+        """
+        if self.api_key.startswith(_AAAI_PREFIX):
+            # ✅ Skip /user check for AAAI keys (backend validates later automatically)
+            return
+
+        if _key_is_validated(self.api_key):
+            # Recently validated by another client in this process
+            return
+
+        # ✅ Normal Supabase JWT validation
+        url = self._urls["user"]
+        try:
+            response = self._request("GET", url, timeout=self._default_timeout)
+            res = _json_loads(response.content)
+            content = res.get("content") or _EMPTY
+            if res.get("status_code") == 200 and content.get("valid"):
+                _remember_validated_key(self.api_key)
+                return
+            raise InvalidAPIKeyError("Invalid API key provided.")
+        except (requests.RequestException, ValueError):
+            raise InvalidAPIKeyError("Invalid API key provided.")
+        
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _with_network_retry(self, send: Callable[[], Any], attempts: int = 3, backoff: float = 0.5):
+        """
+        Private helper for write endpoints: call send() and retry only when no
+        connection could be made (see _failed_before_send), never on an HTTP
+        error status, with jittered exponential backoff between attempts.
+        """
+        for attempt in range(attempts):
+            try:
+                return send()
+            except CircuitOpenError:
+                raise
+            except requests.exceptions.ConnectionError as e:
+                # After a reset or dropped connection the server may already
+                # have run the write, so replaying it could apply it twice.
+                if attempt == attempts - 1 or not _failed_before_send(e):
+                    raise
+                time.sleep(backoff * (2 ** attempt) + random.uniform(0, backoff))
+
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Private helper: every HTTP call goes through the client's session so the
+        transport (requests or HTTP/2 httpx) is pluggable. A missing or None
+        timeout falls back to the client's default.
+
+        Calls pass through the backend's circuit breaker: while it is open this
+        raises CircuitOpenError (a requests ConnectionError) immediately
+        instead of waiting out another timeout.
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._default_timeout
+        breaker = self._breaker
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self.base_url}; backend is failing, retry later.")
+        try:
+            response = self._send(method, url, **kwargs)
+        except _CLIENT_SIDE_ERRORS:
+            # Rejected before sending (invalid URL or header): not the
+            # backend's fault, so record nothing, but give back the slot.
+            breaker.release_probe()
+            raise
+        except requests.exceptions.RequestException:
+            # Timeouts, connection errors and other transport failures
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Not the backend's fault either (a header value requests can't
+            # encode as latin-1, KeyboardInterrupt): record nothing, but don't
+            # leave a half-open breaker waiting for a probe that will never report.
+            breaker.release_probe()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def _call(self, method: str, endpoint: str, *, network_retry: bool = False, **kwargs):
+        """
+        Private helper for the endpoints that raise on failure: sends the
+        request to self._urls[endpoint], decodes it with _handle_response and
+        reports transport failures as Exception("Connection error: ...").
+        network_retry=True sends it through _with_network_retry.
+        """
+        url = self._urls[endpoint]
+        try:
+            if network_retry:
+                response = self._with_network_retry(lambda: self._request(method, url, **kwargs))
+            else:
+                response = self._request(method, url, **kwargs)
+            return self._handle_response(response)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Connection error: {e}")
+
+    def _handle_response(self, response: requests.Response):
+            """
+            Private helper to parse responses and raise errors.
+            """
+            status_code = response.status_code
+            body = response.content
+
+            # Fast path: successful responses are decoded and returned directly.
+            # ValueError covers orjson.JSONDecodeError and, with the stdlib
+            # fallback, UnicodeDecodeError for bodies that aren't UTF-8.
+            if status_code < 400:
+                try:
+                    return _json_loads(body)
+                except ValueError:
+                    return {"status": "error", "message": "Unknown server error"}
+
+            try:
+                data = _json_loads(body)
+            except ValueError:
+                response.raise_for_status()
+                return {"status": "error", "message": "Unknown server error"}
+
+            if isinstance(data, dict):
+                for key in _ERROR_KEYS:
+                    error_message = data.get(key)
+                    if error_message:
+                        break
+                else:
+                    error_message = "Unknown API error"
+            else:
+                error_message = data
+            raise APIError(f"API Error (HTTP {status_code}): {error_message}", status_code)
+
+    def _json_or_http_error(self, response: requests.Response):
+        """
+        Private helper for the endpoints that report HTTP errors as a dict
+        instead of raising: decodes a successful body, or builds the error dict
+        straight from the status (same details text as raise_for_status)
+        without raising and catching an HTTPError first.
+        """
+        status_code = response.status_code
+        if status_code < 400:
+            return _json_loads(response.content)
+        return {
+            "error": "HTTP error occurred",
+            "status_code": status_code,
+            "details": _http_error_details(status_code, response.reason, response.url),
+            "response_text": response.text
+        }
+
+    def _handle_binary_response(self, response: requests.Response):
+            """
+            Private helper for file endpoints: JSON bodies go through _handle_response,
+            anything else is returned as the raw (possibly streamed) response.
+            """
+            if "application/json" in response.headers.get("Content-Type", ""):
+                return self._handle_response(response)
+            response.raise_for_status()
+            return response
+
+    def invalidate_models_cache(self):
+        """
+        Drop cached model listings so the next get_*_models call hits the server.
+        """
+        self._models_cache.clear()
+
+    def invalidate_cache(self):
+        """
+        Drop cached app/tool/connection and user profile lookups so the next
+        call hits the server.
+        """
+        self._response_cache.clear()
+
+    clear_validation_cache = staticmethod(clear_validation_cache)
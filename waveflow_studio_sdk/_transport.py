@@ -0,0 +1,129 @@
+"""
+HTTP/2 transport for WaveFlowStudio.
+
+Wraps an ``httpx.Client`` so it can stand in for the ``requests.Session``
+the client uses by default: same ``request()`` signature, responses that
+look like ``requests.Response`` and exceptions translated to
+``requests.exceptions`` so existing error handling keeps working.
+"""
+import requests
+
+# httpx is optional and only imported on first use (see _load_httpx), so
+# clients on the default requests transport never pay for importing it.
+httpx = None
+
+
+def _load_httpx():
+    """Imports httpx on first use; raises ImportError if it is not installed."""
+    global httpx
+    if httpx is None:
+        import httpx as _httpx
+        httpx = _httpx
+    return httpx
+
+
+def _is_connect_error(exc) -> bool:
+    """True if exc is an httpx ConnectError, i.e. no connection was ever established."""
+    return httpx is not None and isinstance(exc, httpx.ConnectError)
+
+
+def _to_httpx_timeout(timeout):
+    """Converts a requests-style timeout (float or (connect, read)) to httpx.Timeout."""
+    _load_httpx()
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class _HTTPXResponse:
+    """Minimal requests.Response look-alike over an httpx.Response."""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.reason = response.reason_phrase
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def json(self, **kwargs):
+        return self._response.json(**kwargs)
+
+    def iter_content(self, chunk_size=None, decode_unicode=False):
+        if decode_unicode:
+            return self._response.iter_text(chunk_size)
+        return self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self,
+            )
+
+    def close(self):
+        self._response.close()
+
+
+class _HTTPXSession:
+    """Adapts httpx.Client (HTTP/2 enabled) to the requests.Session call style."""
+
+    def __init__(self, timeout):
+        try:
+            _load_httpx()
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 support requires httpx: pip install \"waveflow-studio-sdk[http2]\""
+            )
+        self._client = httpx.Client(
+            http2=True,
+            timeout=_to_httpx_timeout(timeout),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        )
+        # Default headers sent with every request, like requests.Session.headers
+        self.headers = self._client.headers
+
+    def request(self, method, url, *, data=None, json=None, files=None,
+                params=None, headers=None, timeout=None, stream=False):
+        # stream is accepted for call compatibility but ignored: the body is
+        # always read in full, so streaming callers parse it from memory.
+        # httpx wants raw bodies as content=, form fields as data=.
+        content = None
+        if isinstance(data, (bytes, str)):
+            content, data = data, None
+        elif isinstance(data, list):
+            # requests-style (name, value) form pairs; httpx wants a mapping
+            data = dict(data)
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = _to_httpx_timeout(timeout)
+        try:
+            response = self._client.request(
+                method, url, content=content, data=data, json=json, files=files,
+                params=params, headers=headers, **kwargs
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except (httpx.ConnectError, httpx.NetworkError) as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+        return _HTTPXResponse(response)
+
+    def close(self):
+        self._client.close()
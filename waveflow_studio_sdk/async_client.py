@@ -0,0 +1,474 @@
+"""
+Asyncio client for the WaveFlow Studio tools/apps and user profile endpoints.
+
+Requires httpx: pip install "waveflow-studio-sdk[async]"
+
+    client = await AsyncWaveFlowStudio.create(api_key)
+    tools, apps, connections = await asyncio.gather(
+        client.get_tools(), client.get_apps(), client.get_connections()
+    )
+    profile = await client.fetch_all()
+"""
+import asyncio
+import os
+from typing import Optional, Dict, Any, List
+
+from ._base import (
+    _WaveFlowStudioBase,
+    InvalidAPIKeyError,
+    _json_loads,
+    _json_dumps,
+    _body_error,
+    _tool_fields_result,
+    _execute_tool_result,
+    _http_error_details,
+    _EMPTY,
+    _JSON_HEADERS,
+    _AAAI_PREFIX,
+    _key_is_validated,
+    _remember_validated_key,
+    clear_validation_cache,
+    DEFAULT_TIMEOUT,
+)
+from ._transport import _to_httpx_timeout
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncWaveFlowStudio:
+    """
+    Async counterpart of WaveFlowStudio for the tools, apps, connections and
+    file-lookup endpoints. Methods return the same shapes as the sync client.
+
+    Build instances with ``await AsyncWaveFlowStudio.create(...)`` so the API key
+    is validated without blocking; close with ``await client.aclose()`` or use
+    ``async with``.
+    """
+
+    _handle_response = _WaveFlowStudioBase._handle_response
+    clear_validation_cache = staticmethod(clear_validation_cache)
+
+    def __init__(self, api_key: str, base_url: str = "http://3.92.146.100:5000", use_http2: bool = False):
+        """
+        Set use_http2=True to multiplex concurrent calls (e.g. under
+        asyncio.gather) as streams on one HTTP/2 connection instead of one
+        HTTP/1.1 connection per in-flight call (requires the http2 extra and
+        an https:// base_url; HTTP/2 is only negotiated over TLS).
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncWaveFlowStudio requires httpx: pip install \"waveflow-studio-sdk[async]\""
+            )
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=use_http2,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=_to_httpx_timeout(DEFAULT_TIMEOUT),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+
+    @classmethod
+    async def create(cls, api_key: str, base_url: str = "http://3.92.146.100:5000",
+                     use_http2: bool = False) -> "AsyncWaveFlowStudio":
+        """
+        Build a client and validate its API key (same rules as WaveFlowStudio).
+        """
+        self = cls(api_key, base_url, use_http2=use_http2)
+        try:
+            await self._validate_api_key()
+        except BaseException:
+            await self.aclose()
+            raise
+        return self
+
+    async def _validate_api_key(self):
+        if self.api_key.startswith(_AAAI_PREFIX) or _key_is_validated(self.api_key):
+            return
+        try:
+            response = await self._client.get("/user")
+            res = _json_loads(response.content)
+            content = res.get("content") or _EMPTY
+            if res.get("status_code") == 200 and content.get("valid"):
+                _remember_validated_key(self.api_key)
+                return
+            raise InvalidAPIKeyError("Invalid API key provided.")
+        except (httpx.HTTPError, ValueError):
+            raise InvalidAPIKeyError("Invalid API key provided.")
+
+    async def aclose(self):
+        """
+        Close the underlying httpx.AsyncClient.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # File lookups and user metadata
+    # ------------------------------------------------------------------
+
+    async def return_models(self, file_name: str) -> dict:
+        """
+        Fetch model configurations by file name.
+        """
+        try:
+            response = await self._client.post("/return_models", json={"file_name": file_name})
+            return _json_loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            return {"error": str(e)}
+
+    async def return_agents(self, file_name: str) -> dict:
+        """
+        Fetch agent configurations by file name.
+        """
+        try:
+            response = await self._client.post("/return_agents", json={"file_name": file_name})
+            return _json_loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            return {"error": str(e)}
+
+    async def return_workflows(self, file_name: str) -> dict:
+        """
+        Fetch workflow data from a local JSON file on the backend.
+        """
+        try:
+            response = await self._client.post("/return_workflows", json={"file_name": file_name})
+            data = _json_loads(response.content)
+            if response.status_code == 200:
+                return data
+            return {"error": f"Failed with status {response.status_code}", "response": data}
+        except (httpx.HTTPError, ValueError) as e:
+            return {"error": str(e)}
+
+    async def get_user_metadata(self) -> Dict[str, Any]:
+        """
+        Fetches the metadata for the authenticated user.
+
+        Raises:
+            APIError: If the API responds with an error status.
+            Exception: On connection errors.
+        """
+        return await self._call("GET", "/profile/user-metadata")
+
+    # ------------------------------------------------------------------
+    # User profile and usage
+    # ------------------------------------------------------------------
+
+    async def get_user_summary(self):
+        """
+        Fetches the user's summary (workflows, models, tools) from the backend.
+        """
+        try:
+            response = await self._client.get("/get-user-summary")
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            return {
+                "error": "Failed to fetch user summary",
+                "details": str(e)
+            }
+
+    async def user_details(self, username: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch the authenticated user's profile details, sending username (or
+        'Unknown') as the Username header.
+        """
+        try:
+            response = await self._client.get("/profile/user-details", headers={"Username": username or "Unknown"})
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as http_err:
+            return {
+                "error": "HTTP error occurred",
+                "details": str(http_err),
+                "status_code": http_err.response.status_code
+            }
+        except httpx.RequestError as req_err:
+            return {"error": "Request failed", "details": str(req_err)}
+        except ValueError as e:
+            return {"error": "Unexpected failure", "details": str(e)}
+
+    async def get_token_data(self) -> Dict[str, Any]:
+        """
+        Fetches the authenticated user's token and usage data.
+        """
+        try:
+            response = await self._client.get("/token_data")
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as http_err:
+            # Return the server's JSON error body if it has one
+            try:
+                return _json_loads(http_err.response.content)
+            except ValueError:
+                return {"error": f"HTTP error: {http_err}", "status_code": http_err.response.status_code}
+        except httpx.RequestError as req_err:
+            return {"error": f"Request failed: {req_err}"}
+        except ValueError as e:
+            return {"error": f"An unexpected error occurred: {str(e)}"}
+
+    async def update_user_runs(self, run_data: dict):
+        """
+        Updates the user's run count or run data; run_data is sent as the JSON body.
+
+        Raises:
+            ValueError: If run_data is not a dictionary.
+            APIError: If the API responds with an error status.
+            Exception: On connection errors.
+        """
+        if type(run_data) is not dict and not isinstance(run_data, dict):
+            raise ValueError("run_data must be a dictionary.")
+        body = _json_dumps(run_data)
+        return await self._call("POST", "/update-user-runs", content=body, headers=_JSON_HEADERS)
+
+    async def get_user_details(self) -> Dict[str, Any]:
+        """
+        Checks if the current user's token is valid.
+
+        Raises:
+            APIError: If the API responds with an error status.
+            Exception: On connection errors.
+        """
+        return await self._call("GET", "/user")
+
+    async def get_session_data(self) -> Dict[str, Any]:
+        """
+        Fetch all session summaries for the authenticated user.
+        """
+        try:
+            response = await self._client.get("/session_data")
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            return {
+                "error": f"Failed with status {response.status_code}",
+                "response": response.text
+            }
+        except (httpx.HTTPError, ValueError) as e:
+            return {"error": str(e)}
+
+    async def fetch_all(self, username: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch the user summary, profile details, token usage and session data
+        concurrently, so a profile page costs one round trip instead of four.
+
+        Returns:
+            Dict[str, Any]: Results under "summary", "details", "token" and
+            "sessions"; a call that raised is reported as {"error": ...}.
+        """
+        results = await asyncio.gather(
+            self.get_user_summary(),
+            self.user_details(username),
+            self.get_token_data(),
+            self.get_session_data(),
+            return_exceptions=True,
+        )
+        return {
+            key: {"error": str(result)} if isinstance(result, Exception) else result
+            for key, result in zip(("summary", "details", "token", "sessions"), results)
+        }
+
+    # ------------------------------------------------------------------
+    # Tools and apps
+    # ------------------------------------------------------------------
+
+    async def get_tools(self):
+        """
+        Fetch all tools for the authenticated user.
+        """
+        return await self._get_json_or_error("/get_tools", error="Failed to fetch tools")
+
+    async def get_enums_by_app(self, enum_name: str):
+        """
+        Fetches available enums (functions) for a given app/toolkit.
+        """
+        try:
+            response = await self._client.post("/get-enums-by-app", json={"enum": enum_name})
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
+            return {
+                "error": "Failed to fetch enums by app",
+                "details": str(e)
+            }
+
+    async def get_apps(self):
+        """
+        Retrieves the list of available Composio apps (toolkits) from the server.
+        """
+        return await self._get_json_or_error("/apps")
+
+    async def get_connections(self):
+        """
+        Retrieves the list of active connections for the authenticated user.
+        """
+        return await self._get_json_or_error("/connections")
+
+    async def initiate_connection(self, toolkit: str, credentials: Optional[Dict[str, str]] = None):
+        """
+        Initiates a connection for a given toolkit (app). See WaveFlowStudio.initiate_connection.
+        """
+        payload = {"toolkit": toolkit}
+        if credentials:
+            payload["credentials"] = credentials
+        return await self._get_json_or_error("/initiate-connection", method="POST", json=payload)
+
+    async def delete_connection(self, connection_id: str) -> Dict[str, Any]:
+        """
+        Deletes a specific tool connection.
+
+        Raises:
+            ValueError: If connection_id is not provided.
+            APIError: If the API responds with an error status.
+            Exception: On connection errors.
+        """
+        if not connection_id:
+            raise ValueError("connection_id is required.")
+        return await self._call("POST", "/delete_connection", json={"id": connection_id})
+
+    async def filter_apps(self) -> Dict[str, Any]:
+        """
+        Fetch and return available app/tool categories from the backend.
+        """
+        try:
+            response = await self._client.get("/filter_apps")
+            if response.status_code == 200:
+                return {"apps": _json_loads(response.content)}
+            return {"error": _body_error(_json_loads(response.content))}
+        except httpx.RequestError as e:
+            return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": str(e)}
+
+    async def get_tool_info(self, app_name: str) -> Dict[str, Any]:
+        """
+        Fetch tools and details associated with a given app/toolkit name.
+        """
+        if not app_name:
+            return {"error": "app_name is required."}
+        try:
+            response = await self._client.get("/app_info", params={"app_name": app_name})
+            data = _json_loads(response.content)
+            if response.status_code == 200:
+                return data
+            return {"error": _body_error(data)}
+        except httpx.RequestError as e:
+            return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": str(e)}
+
+    async def get_tool_fields(self, slug_name: str) -> Dict[str, Any]:
+        """
+        Fetch required input fields for a specific tool identified by its slug.
+        """
+        if not slug_name:
+            return {"error": "slug_name is required."}
+        try:
+            response = await self._client.post("/fields", params={"slug_name": slug_name}, json={})
+            data = _json_loads(response.content)
+            if response.status_code == 200:
+                return _tool_fields_result(data)
+            return {"error": _body_error(data)}
+        except httpx.RequestError as e:
+            return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": str(e)}
+
+    async def execute_tool(self, slug: str, arguments: dict) -> Dict[str, Any]:
+        """
+        Execute a Composio tool by slug name.
+        """
+        if not slug:
+            return {"error": "Tool slug is required."}
+        try:
+            response = await self._client.post("/execute", json={"slug": slug, "arguments": arguments})
+            data = _json_loads(response.content)
+            return _execute_tool_result(data, response.status_code == 200)
+        except httpx.RequestError as e:
+            return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": str(e)}
+
+    # ------------------------------------------------------------------
+    # User-defined tools
+    # ------------------------------------------------------------------
+
+    async def add_tool(self, token: str, name: str, description: str, file_path: str, secrets: List[dict] = None):
+        """
+        Uploads a Python tool file along with metadata and optional secrets.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found at path: {file_path}")
+
+        data = {
+            "name": name,
+            "description": description
+        }
+        if secrets:
+            for i, secret in enumerate(secrets):
+                data[f"secrets[{i}][key]"] = secret["key"]
+                data[f"secrets[{i}][value]"] = secret["value"]
+
+        try:
+            with open(file_path, "rb") as f:
+                response = await self._client.post(
+                    "/add-tools",
+                    headers={"Authorization": f"Bearer {token}"},
+                    data=data,
+                    files={"file": (os.path.basename(file_path), f)},
+                )
+        except (httpx.HTTPError, OSError) as e:
+            return {"error": f"Request failed: {str(e)}"}
+
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            return {"error": "Invalid response format", "raw_text": response.text}
+
+    async def delete_tool(self, tool_id: str):
+        """
+        Deletes a tool from the database using its unique ID.
+        """
+        return await self._get_json_or_error(f"/delete-tool/{tool_id}", method="DELETE")
+
+    async def _call(self, method: str, path: str, **kwargs):
+        """
+        Private helper for the endpoints that raise on failure, like
+        WaveFlowStudio._call: decodes the response with _handle_response and
+        reports transport failures, and error statuses whose body isn't JSON,
+        as Exception("Connection error: ...").
+        """
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            return self._handle_response(response)
+        except httpx.HTTPError as e:
+            # HTTPError also covers the HTTPStatusError raise_for_status raises
+            raise Exception(f"Connection error: {e}")
+
+    async def _get_json_or_error(self, path: str, method: str = "GET", error: str = "Request failed", **kwargs):
+        """
+        Private helper shared by the endpoints that report failures as a dict:
+        returns the decoded JSON body, or the sync client's HTTP error dict,
+        or {"error": error, "details": ...} for request failures.
+        """
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            status_code = response.status_code
+            if status_code < 400:
+                return _json_loads(response.content)
+            return {
+                "error": "HTTP error occurred",
+                "status_code": status_code,
+                "details": _http_error_details(status_code, response.reason_phrase, response.url),
+                "response_text": response.text
+            }
+        except (httpx.RequestError, ValueError) as req_err:
+            return {"error": error, "details": str(req_err)}
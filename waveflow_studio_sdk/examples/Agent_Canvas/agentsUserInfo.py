@@ -3,6 +3,7 @@
 ##############################################
 
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -60,7 +61,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -104,7 +105,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             return response.json()
 
@@ -125,7 +126,7 @@ class WaveFlowStudio:
             url = f"{self.base_url}/history"
             try:
                 headers=    {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.get(url, headers=headers)
+                response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as req_err:
                 # Handle other request errors (e.g., connection error)
@@ -145,7 +146,7 @@ class WaveFlowStudio:
             payload = {"session_id": session_id}
 
             try:
-                response = requests.post(url, headers=headers, json=payload)
+                response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
                 if response.status_code == 200:
                     return response.json()
                 else:
@@ -170,7 +171,7 @@ class WaveFlowStudio:
         payload = {"session_id": session_id}
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -5,6 +5,7 @@
 
 
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT, LLM_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -62,7 +63,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -114,7 +115,7 @@ class WaveFlowStudio:
             return {"error": "No model is added, Please do add one model", "details": "use WaveFlowStudio.set_model() to create one"}
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=LLM_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -155,7 +156,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=LLM_TIMEOUT)
             data = response.json()
 
             # Optionally update workflow_id if backend returns new one
@@ -197,7 +198,7 @@ class WaveFlowStudio:
                 # Use json= to send data as 'application/json'
                 # Use self.headers for authentication
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, json=payload, headers=headers)
+                response = requests.post(url, json=payload, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
@@ -232,7 +233,7 @@ class WaveFlowStudio:
                 files = {"files": (os.path.basename(file_path), open(file_path, "rb"))}
 
             try:
-                response = requests.post(url, headers=headers, data=data, files=files)
+                response = requests.post(url, headers=headers, data=data, files=files, timeout=LLM_TIMEOUT)
                 response.raise_for_status()
                 return response.json()
             except requests.RequestException as e:
@@ -266,7 +267,7 @@ class WaveFlowStudio:
             with open(file_path, "rb") as file:
                 files = {"file": (os.path.basename(file_path), file)}
                 data = {"user_id": user_id}
-                response = requests.post(url, headers=headers, files=files, data=data)
+                response = requests.post(url, headers=headers, files=files, data=data, timeout=DEFAULT_TIMEOUT)
 
             try:
                 return response.json()
@@ -316,7 +317,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
             data = response.json()
 
             # Optional: Update stored workflow_id if backend returns new session
@@ -350,7 +351,7 @@ class WaveFlowStudio:
 
         try:
             # Make the GET request
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             
             # Check for HTTP errors (e.g., 4xx or 5xx responses)
             response.raise_for_status()
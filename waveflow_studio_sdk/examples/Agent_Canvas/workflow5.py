@@ -5,6 +5,7 @@
 
 
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT, LLM_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -62,7 +63,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -114,7 +115,7 @@ class WaveFlowStudio:
             return {"error": "No model is added, Please do add one model", "details": "use WaveFlowStudio.set_model() to create one"}
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=LLM_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -149,7 +150,7 @@ class WaveFlowStudio:
                 # Use json= to send data as 'application/json'
                 # Use self.headers for authentication
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, json=payload, headers=headers)
+                response = requests.post(url, json=payload, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
@@ -189,7 +190,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=LLM_TIMEOUT)
             data = response.json()
 
             # Optionally update workflow_id if backend returns new one
@@ -220,7 +221,7 @@ class WaveFlowStudio:
             }
             
             try:
-                response = requests.get(url, headers=headers)
+                response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
                 
                 # Raise an exception for bad status codes (4xx, 5xx)
                 response.raise_for_status()
@@ -245,7 +246,7 @@ class WaveFlowStudio:
         with open(file_path, "rb") as f:
             files = {"file": (os.path.basename(file_path), f)}
             headers = {"Authorization": f"Bearer {self.api_key}"}  # minimal auth only
-            response = requests.post(url, headers=headers, files=files)
+            response = requests.post(url, headers=headers, files=files, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
         return response.json()
     def extract_text(self, file_path: str):
@@ -273,7 +274,7 @@ class WaveFlowStudio:
                     # parameter name: async def extract_text(file: UploadFile ...):
                     files = {"file": (os.path.basename(file_path), f)}
                     
-                    response = requests.post(url, files=files)
+                    response = requests.post(url, files=files, timeout=DEFAULT_TIMEOUT)
                     
                     # Raise an exception for bad responses (4xx or 5xx)
                     response.raise_for_status()
@@ -339,7 +340,7 @@ class WaveFlowStudio:
             try:
                 headers = {"Authorization": f"Bearer {self.api_key}"}
                 # Use 'data' instead of 'json' because the endpoint uses Form(...)
-                response = requests.post(url, data=payload, headers=headers)
+                response = requests.post(url, data=payload, headers=headers, timeout=LLM_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
@@ -371,7 +372,7 @@ class WaveFlowStudio:
             
             try:
                 headers = {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, headers=headers, json=payload)
+                response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
@@ -402,7 +403,7 @@ class WaveFlowStudio:
             
             try:
                 headers = {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, headers=headers, json=payload)
+                response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
                 # _handle_response will correctly return the JSON for 200 OK
                 # whether it contains 'data' or 'message'
                 return self._handle_response(response)
@@ -448,7 +449,7 @@ class WaveFlowStudio:
                 # We use 'data=' for form data.
                 # We do NOT pass 'headers' because this endpoint is unauthenticated
                 # and 'requests' will set the 'Content-Type' for 'data=' automatically.
-                response = requests.post(url, data=payload)
+                response = requests.post(url, data=payload, timeout=LLM_TIMEOUT)
                 
                 # We can still use _handle_response to parse the JSON *response*
                 return self._handle_response(response)
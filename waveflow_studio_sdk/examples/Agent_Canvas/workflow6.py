@@ -2,6 +2,7 @@
 # Generating prompts with enhance_prompt, suprise_me, edit_with_ai and geting agents
 ##############################################
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT, LLM_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -59,7 +60,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -114,7 +115,7 @@ class WaveFlowStudio:
         body = {"prompt": prompt}
 
         try:
-            response = requests.post(url, headers=headers, json=body)
+            response = requests.post(url, headers=headers, json=body, timeout=LLM_TIMEOUT)
             data = response.json()
 
             if response.status_code != 200:
@@ -141,7 +142,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -169,8 +170,9 @@ class WaveFlowStudio:
 
         body = {"prompt": prompt}
 
+        response = None
         try:
-            response = requests.post(url, headers=headers, json=body)
+            response = requests.post(url, headers=headers, json=body, timeout=LLM_TIMEOUT)
             response.raise_for_status()
             return response.json()
 
@@ -178,7 +180,7 @@ class WaveFlowStudio:
             return {
                 "error": "HTTP error occurred",
                 "details": str(http_err),
-                "status_code": response.status_code if 'response' in locals() else None
+                "status_code": response.status_code if response is not None else None
             }
 
         except requests.exceptions.RequestException as req_err:
@@ -208,7 +210,7 @@ class WaveFlowStudio:
             return {"error": "No model is added, Please do add one model", "details": "use WaveFlowStudio.set_model() to create one"}
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=LLM_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
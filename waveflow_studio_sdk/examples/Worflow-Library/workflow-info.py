@@ -1,4 +1,5 @@
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT, LLM_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -56,7 +57,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -97,7 +98,7 @@ class WaveFlowStudio:
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             data = response.json()
 
             if response.status_code == 200:
@@ -126,7 +127,7 @@ class WaveFlowStudio:
             try:
                 # Use self.headers for authentication
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.get(url, headers=headers)
+                response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
                 
                 # This endpoint returns a list directly on success,
                 # so we modify the standard handler logic slightly.
@@ -161,7 +162,7 @@ class WaveFlowStudio:
             
             try:
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.get(url, params=params, headers=headers)
+                response = requests.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
                 # The improved _handle_response will catch 200 OK errors
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
@@ -190,7 +191,7 @@ class WaveFlowStudio:
             
             try:
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.get(url, params=params, headers=headers)
+                response = requests.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
                 # The improved _handle_response will catch 200 OK errors
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
@@ -212,7 +213,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = requests.post(url, headers=headers, json=data, timeout=LLM_TIMEOUT)
             data = response.json()
             # print(data)
             return {"answer": data.get("final_answer"), "conversation":data.get("conversation"), "citation": data.get("citation")}
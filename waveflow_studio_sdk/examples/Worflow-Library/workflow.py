@@ -1,4 +1,5 @@
 import requests
+from waveflow_studio_sdk._base import DEFAULT_TIMEOUT, LLM_TIMEOUT
 import json
 from typing import Optional, Dict, Any, Union
 import uuid
@@ -56,7 +57,7 @@ class WaveFlowStudio:
         url = f"{self.base_url}/user"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             res = response.json()
             if res.get("status_code") == 200 and res.get("content", {}).get("valid"):
                 return
@@ -101,7 +102,7 @@ class WaveFlowStudio:
         params = {"user_id": user_id}
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = requests.get(url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
             data = response.json()
 
             if response.status_code == 200:
@@ -130,7 +131,7 @@ class WaveFlowStudio:
             body = {
                 "agents_data" : json_data
             }
-            response = requests.post(url, headers=headers, json = body)
+            response = requests.post(url, headers=headers, json = body, timeout=DEFAULT_TIMEOUT)
             
             resp_json = response.json()
             # print("this is response :",resp_json)
@@ -166,7 +167,7 @@ class WaveFlowStudio:
             
             try:
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, json=payload, headers=headers)
+                response = requests.post(url, json=payload, headers=headers, timeout=DEFAULT_TIMEOUT)
                 
                 # This endpoint returns custom status_code in its body.
                 # We'll rely on _handle_response for HTTP errors, but also
@@ -215,7 +216,7 @@ class WaveFlowStudio:
             try:
                 # Note: We use 'params=' here, not 'json='
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.put(url, params=params, headers=headers)
+                response = requests.put(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
                 
             except requests.exceptions.RequestException as e:
@@ -289,7 +290,7 @@ class WaveFlowStudio:
                 
             try:
                 # Send data as form fields
-                response = requests.post(url, headers=headers, data=data)
+                response = requests.post(url, headers=headers, data=data, timeout=LLM_TIMEOUT)
                 response.raise_for_status()
                 return response.json()
                 
@@ -316,7 +317,7 @@ class WaveFlowStudio:
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            response = requests.post(url, headers=headers, json=workflows_data)
+            response = requests.post(url, headers=headers, json=workflows_data, timeout=DEFAULT_TIMEOUT)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -344,7 +345,7 @@ class WaveFlowStudio:
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
         try:
-            response = requests.delete(url, headers=headers)
+            response = requests.delete(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             data = response.json()
             if response.status_code == 200:
                 # Optionally clear workflow_id if deleted
@@ -384,7 +385,7 @@ class WaveFlowStudio:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
             return response.json()
         except Exception as e:
             return {"error": str(e)}
@@ -428,7 +429,7 @@ class WaveFlowStudio:
             
             try:
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, json=payload, headers=headers)
+                response = requests.post(url, json=payload, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
@@ -458,7 +459,7 @@ class WaveFlowStudio:
             
             try:
                 headers= {"Authorization": f"Bearer {self.api_key}"}
-                response = requests.post(url, json=payload, headers=headers)
+                response = requests.post(url, json=payload, headers=headers, timeout=DEFAULT_TIMEOUT)
                 return self._handle_response(response)
             except requests.exceptions.RequestException as e:
                 raise Exception(f"Connection error: {e}")
\ No newline at end of file